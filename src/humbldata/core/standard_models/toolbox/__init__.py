@@ -25,6 +25,7 @@ end_date : str
 """
 
 import datetime as dt
+import re
 
 import pandera as pa
 import polars as pl
@@ -39,6 +40,9 @@ from humbldata.core.utils.descriptions import (
     QUERY_DESCRIPTIONS,
 )
 
+_INTERVAL_PATTERN = re.compile(r"^\d*[smhdWMQY]$")
+_DATE_PATTERN = re.compile(r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])$")
+
 
 class ToolboxQueryParams(QueryParams):
     """
@@ -169,9 +173,7 @@ class ToolboxQueryParams(QueryParams):
         ValueError
             If the interval format is invalid.
         """
-        import re
-
-        if not re.match(r"^\d*[smhdWMQY]$", v):
+        if not _INTERVAL_PATTERN.match(v):
             msg = "Invalid interval format. Must be a number followed by one of 's', 'm', 'h', 'd', 'W', 'M', 'Q', 'Y'."
             raise ValueError(msg)
         return v
@@ -199,9 +201,7 @@ class ToolboxQueryParams(QueryParams):
         ValueError
             If the date format is invalid.
         """
-        import re
-
-        if not re.match(r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])$", v):
+        if not _DATE_PATTERN.match(v):
             msg = "Invalid date format. Must be YYYY-MM-DD with MM between 01 and 12, and DD between 01 and 31."
             raise ValueError(msg)
         return v
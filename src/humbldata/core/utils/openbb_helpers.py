@@ -6,8 +6,11 @@ to have specific data outputs.
 """
 
 import asyncio
+import functools
 import logging
+import time
 import warnings
+from typing import Any
 
 import dotenv
 import polars as pl
@@ -21,6 +24,164 @@ from humbldata.core.utils.constants import (
 )
 from humbldata.core.utils.env import Env
 
+logging.getLogger("openbb_terminal.stocks.stocks_model").setLevel(
+    logging.CRITICAL
+)
+
+
+def _as_list(symbols: str | list[str] | pl.Series) -> list[str]:
+    """
+    Normalize a symbol, comma-separated symbols or a Series to a list.
+
+    Symbols are stripped and upper-cased so cache keys match the symbols
+    OpenBB returns, and empty entries such as the one left by a trailing
+    comma are dropped.
+    """
+    if isinstance(symbols, str):
+        symbols = symbols.split(",")
+    elif isinstance(symbols, pl.Series):
+        symbols = symbols.to_list()
+    normalized = (symbol.strip().upper() for symbol in symbols)
+    return [symbol for symbol in normalized if symbol]
+
+
+class _SymbolCache:
+    """
+    A per-symbol TTL cache of the single-row frames returned by a helper.
+
+    Rows are kept in insertion order, so the oldest entry is always first.
+    Expired rows are dropped as they are found, and the oldest rows are
+    evicted once more than `maxsize` symbols are cached.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._rows: dict[
+            tuple[str | None, str], tuple[float, pl.DataFrame]
+        ] = {}
+
+    def lookup(
+        self, symbols: list[str], provider: str | None
+    ) -> tuple[list[pl.DataFrame], list[str]]:
+        """Split `symbols` into fresh cached rows and symbols to fetch."""
+        now = time.monotonic()
+        cached: list[pl.DataFrame] = []
+        missing: list[str] = []
+        for symbol in symbols:
+            key = (provider, symbol)
+            entry = self._rows.get(key)
+            if entry is not None and now - entry[0] <= self.ttl:
+                cached.append(entry[1])
+            else:
+                self._rows.pop(key, None)
+                missing.append(symbol)
+        return cached, missing
+
+    def store(self, data: pl.DataFrame, provider: str | None) -> None:
+        """Cache each row of `data` under its symbol."""
+        now = time.monotonic()
+        for row in data.partition_by("symbol"):
+            key = (provider, row.item(0, "symbol"))
+            # Re-inserting moves a refreshed symbol to the end of the order
+            self._rows.pop(key, None)
+            self._rows[key] = (now, row)
+        self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        """Drop the oldest rows while they are expired or over `maxsize`."""
+        while self._rows:
+            key, (stored_at, _) = next(iter(self._rows.items()))
+            if now - stored_at <= self.ttl and len(self._rows) <= self.maxsize:
+                break
+            del self._rows[key]
+
+    def clear(self) -> None:
+        """Drop every cached row."""
+        self._rows.clear()
+
+
+_QUOTE_CACHE = _SymbolCache(ttl=60.0)
+_SECTOR_CACHE = _SymbolCache(ttl=86_400.0)
+_CATEGORY_CACHE = _SymbolCache(ttl=86_400.0)
+
+
+def _concat_rows(
+    frames: list[pl.DataFrame], symbols: list[str]
+) -> pl.LazyFrame:
+    """Concatenate cached and fetched rows back into the order of `symbols`."""
+    order = {symbol: index for index, symbol in enumerate(symbols)}
+    return (
+        pl.concat(frames, how="vertical_relaxed")
+        .sort(
+            pl.col("symbol").replace(
+                order, default=None, return_dtype=pl.UInt32
+            ),
+            nulls_last=True,
+        )
+        .lazy()
+    )
+
+
+def _null_frame(symbols: list[str], column: str) -> pl.DataFrame:
+    return pl.DataFrame({"symbol": symbols}).with_columns(
+        pl.lit(None, dtype=pl.Utf8).alias(column)
+    )
+
+
+def clear_sector_cache() -> None:
+    """Clear the process-level cache of sector and ETF category lookups."""
+    _SECTOR_CACHE.clear()
+    _CATEGORY_CACHE.clear()
+
+
+def clear_openbb_caches() -> None:
+    """Clear every process-level OpenBB helper cache, including quotes."""
+    _QUOTE_CACHE.clear()
+    clear_sector_cache()
+
+
+_inflight_calls: dict[tuple[Any, ...], asyncio.Task[Any]] = {}
+
+
+def _finish_shared_call(key: tuple[Any, ...], task: asyncio.Task[Any]) -> None:
+    """Forget a finished shared call and mark its exception as retrieved."""
+    _inflight_calls.pop(key, None)
+    if not task.cancelled():
+        # If every caller was cancelled, nobody else reads a failure
+        task.exception()
+
+
+async def _ashared_obb_call(
+    obb_path: str,
+    symbols: str | list[str] | pl.Series,
+    provider: str | None,
+) -> Any:
+    """
+    Run a blocking `obb` command in a worker thread, coalescing duplicates.
+
+    Concurrent callers asking the same command for the same symbols and
+    provider await one shared call instead of each issuing its own request.
+    The shared call is shielded, so cancelling one caller does not cancel it
+    for the others.
+    """
+    # Tasks are bound to their event loop, so calls are only shared within one
+    key = (
+        asyncio.get_running_loop(),
+        obb_path,
+        provider,
+        tuple(sorted(_as_list(symbols))),
+    )
+    task = _inflight_calls.get(key)
+    if task is None:
+        command = functools.reduce(getattr, obb_path.split("."), obb)
+        task = asyncio.create_task(
+            asyncio.to_thread(command, symbols, provider=provider)
+        )
+        _inflight_calls[key] = task
+        task.add_done_callback(functools.partial(_finish_shared_call, key))
+    return await asyncio.shield(task)
+
 
 def obb_login(pat: str | None = None) -> bool:
     """
@@ -107,10 +268,6 @@ def get_latest_price(
         A Polars LazyFrame with columns for the stock symbols ('symbol') and
         their latest prices ('last_price').
     """
-    logging.getLogger("openbb_terminal.stocks.stocks_model").setLevel(
-        logging.CRITICAL
-    )
-
     return (
         obb.equity.price.quote(symbol, provider=provider)
         .to_polars()
@@ -149,6 +306,10 @@ async def aget_latest_price(
 
     Notes
     -----
+    Quotes are cached per symbol and provider for 60 seconds, so repeated
+    calls only fetch symbols without a fresh quote; call
+    `clear_openbb_caches()` first when a fresh quote is required.
+
     If you run into an error: `RuntimeError: asyncio.run() cannot be called from a running event loop`
     you can use the following code to apply the asyncio event loop to the current thread:
     ```
@@ -156,33 +317,33 @@ async def aget_latest_price(
     nest_asyncio.apply()
     ```
     """
-    logging.getLogger("openbb_terminal.stocks.stocks_model").setLevel(
-        logging.CRITICAL
-    )
-
-    loop = asyncio.get_event_loop()
-    result = await loop.run_in_executor(
-        None, lambda: obb.equity.price.quote(symbol, provider=provider)
-    )
-    out = result.to_polars().lazy()
-    if {"last_price", "prev_close"}.issubset(out.columns):
-        out = out.select(
+    symbols = _as_list(symbol)
+    cached, missing = _QUOTE_CACHE.lookup(symbols, provider)
+    if cached and not missing:
+        return _concat_rows(cached, symbols)
+
+    result = await _ashared_obb_call("equity.price.quote", missing, provider)
+    quotes = result.to_polars()
+    columns = set(quotes.columns)
+    if {"last_price", "prev_close"}.issubset(columns):
+        prices = quotes.select(
             [
+                pl.col("symbol"),
                 pl.when(pl.col("asset_type") == "ETF")
                 .then(pl.col("prev_close"))
                 .otherwise(pl.col("last_price"))
                 .alias("last_price"),
-                pl.col("symbol"),
             ]
         )
-    elif "last_price" not in out.columns:
-        out = out.select(
+    elif "last_price" not in columns:
+        prices = quotes.select(
             pl.col("symbol"), pl.col("prev_close").alias("last_price")
         )
     else:
-        out = out.select(pl.col("symbol"), pl.col("last_price"))
+        prices = quotes.select(pl.col("symbol"), pl.col("last_price"))
 
-    return out
+    _QUOTE_CACHE.store(prices, provider)
+    return _concat_rows([*cached, prices], symbols)
 
 
 def get_equity_sector(
@@ -213,19 +374,24 @@ def get_equity_sector(
     -----
     This function uses OpenBB's equity profile data to fetch sector information.
     It returns a lazy frame for efficient processing, especially with large datasets.
+    Successful lookups are cached per symbol and provider for 24 hours, so
+    only uncached symbols are fetched; call `clear_sector_cache()` to drop
+    them.
     """
+    symbols = _as_list(symbols)
+    cached, missing = _SECTOR_CACHE.lookup(symbols, provider)
+    if cached and not missing:
+        return _concat_rows(cached, symbols)
     try:
-        result = obb.equity.profile(symbols, provider=provider)
-        return result.to_polars().select(["symbol", "sector"]).lazy()
+        result = obb.equity.profile(missing, provider=provider)
+        sectors = result.to_polars().select(["symbol", "sector"])
     except pl.exceptions.ColumnNotFoundError:
         # If an error occurs, return a LazyFrame with symbol and null sector
-        if isinstance(symbols, str):
-            symbols = [symbols]
-        elif isinstance(symbols, pl.Series):
-            symbols = symbols.to_list()
-        return pl.LazyFrame(
-            {"symbol": symbols, "sector": [None] * len(symbols)}
+        return _concat_rows(
+            [*cached, _null_frame(missing, "sector")], symbols
         )
+    _SECTOR_CACHE.store(sectors, provider)
+    return _concat_rows([*cached, sectors], symbols)
 
 
 async def aget_equity_sector(
@@ -262,6 +428,9 @@ async def aget_equity_sector(
     -----
     This function uses OpenBB's equity profile data to fetch sector information.
     It returns a lazy frame for efficient processing, especially with large datasets.
+    Successful lookups are cached per symbol and provider for 24 hours, so
+    only uncached symbols are fetched; call `clear_sector_cache()` to drop
+    them.
 
     If you just pass an ETF to the `obb.equity.profile` function, it will throw
     return data without the NULL columns (sector column included) and only
@@ -270,21 +439,20 @@ async def aget_equity_sector(
     so we can select the sector column from the ETF data and return it as a
     NULL sector for the equity.
     """
-    loop = asyncio.get_event_loop()
+    symbols = _as_list(symbols)
+    cached, missing = _SECTOR_CACHE.lookup(symbols, provider)
+    if cached and not missing:
+        return _concat_rows(cached, symbols)
     try:
-        result = await loop.run_in_executor(
-            None, lambda: obb.equity.profile(symbols, provider=provider)
-        )
-        return result.to_polars().select(["symbol", "sector"]).lazy()
+        result = await _ashared_obb_call("equity.profile", missing, provider)
+        sectors = result.to_polars().select(["symbol", "sector"])
     except pl.exceptions.ColumnNotFoundError:
         # If an error occurs, return a LazyFrame with symbol and null sector
-        if isinstance(symbols, str):
-            symbols = [symbols]
-        elif isinstance(symbols, pl.Series):
-            symbols = symbols.to_list()
-        return pl.LazyFrame(
-            {"symbol": symbols, "sector": [None] * len(symbols)}
+        return _concat_rows(
+            [*cached, _null_frame(missing, "sector")], symbols
         )
+    _SECTOR_CACHE.store(sectors, provider)
+    return _concat_rows([*cached, sectors], symbols)
 
 
 async def aget_etf_category(
@@ -312,32 +480,74 @@ async def aget_etf_category(
     pl.LazyFrame
         A Polars LazyFrame with columns for the ETF symbols ('symbol') and
         their corresponding categories ('category').
-    """
-    loop = asyncio.get_event_loop()
 
+    Notes
+    -----
+    Categories are cached per symbol and provider for 24 hours, so only
+    uncached symbols are fetched; call `clear_sector_cache()` to drop them.
+    """
+    symbols = _as_list(symbols)
+    cached, missing = _CATEGORY_CACHE.lookup(symbols, provider)
+    if cached and not missing:
+        return _concat_rows(cached, symbols)
     try:
-        result = await loop.run_in_executor(
-            None, lambda: obb.etf.info(symbols, provider=provider)
-        )
-        out = result.to_polars().select(["symbol", "category"]).lazy()
-        # Create a LazyFrame with all input symbols
-        all_symbols = pl.LazyFrame({"symbol": symbols})
-
-        # Left join to include all input symbols, filling missing sectors with null
-        out = all_symbols.join(out, on="symbol", how="left").with_columns(
-            [
-                pl.when(pl.col("category").is_null())
-                .then(None)
-                .otherwise(pl.col("category"))
-                .alias("category")
-            ]
-        )
+        result = await _ashared_obb_call("etf.info", missing, provider)
+        categories = result.to_polars().select(["symbol", "category"])
     except OpenBBError:
-        if isinstance(symbols, str):
-            symbols = [symbols]
-        elif isinstance(symbols, pl.Series):
-            symbols = symbols.to_list()
-        return pl.LazyFrame(
-            {"symbol": symbols, "category": [None] * len(symbols)}
+        return _concat_rows(
+            [*cached, _null_frame(missing, "category")], symbols
+        )
+    # Only a single row for exactly the requested symbol skips the reindex join
+    if not (
+        len(missing) == 1
+        and categories.height == 1
+        and categories.item(0, "symbol") == missing[0]
+    ):
+        # Left join to include all input symbols, filling missing categories
+        # with null
+        categories = pl.DataFrame({"symbol": missing}).join(
+            categories, on="symbol", how="left"
         )
-    return out
+    _CATEGORY_CACHE.store(categories, provider)
+    return _concat_rows([*cached, categories], symbols)
+
+
+async def aget_equity_bundle(
+    symbols: str | list[str] | pl.Series,
+    price_provider: OBB_EQUITY_PRICE_QUOTE_PROVIDERS | None = "yfinance",
+    sector_provider: OBB_EQUITY_PROFILE_PROVIDERS | None = "yfinance",
+    category_provider: OBB_ETF_INFO_PROVIDERS | None = "yfinance",
+) -> tuple[pl.LazyFrame, pl.LazyFrame, pl.LazyFrame]:
+    """
+    Context: Core || Category: Utils || Subcategory: OpenBB Helpers ||
+    **Command: aget_equity_bundle**.
+
+    A standalone convenience that fetches the latest price, equity sector and
+    ETF category for the given symbol(s) with a single `asyncio.gather`. Use
+    it when all three frames are needed for the same symbols; callers whose
+    lookups depend on each other should await the helpers individually.
+
+    Parameters
+    ----------
+    symbols : str | list[str] | pl.Series
+        The symbol(s) to query. Accepts a single symbol, a list of symbols, or
+        a Polars Series of symbols.
+    price_provider : OBB_EQUITY_PRICE_QUOTE_PROVIDERS | None, optional
+        The data provider passed to `aget_latest_price`. Default is `yfinance`.
+    sector_provider : OBB_EQUITY_PROFILE_PROVIDERS | None, optional
+        The data provider passed to `aget_equity_sector`. Default is `yfinance`.
+    category_provider : OBB_ETF_INFO_PROVIDERS | None, optional
+        The data provider passed to `aget_etf_category`. Default is `yfinance`.
+
+    Returns
+    -------
+    tuple[pl.LazyFrame, pl.LazyFrame, pl.LazyFrame]
+        The outputs of `aget_latest_price`, `aget_equity_sector` and
+        `aget_etf_category`, in that order.
+    """
+    prices, sectors, categories = await asyncio.gather(
+        aget_latest_price(symbols, provider=price_provider),
+        aget_equity_sector(symbols, provider=sector_provider),
+        aget_etf_category(symbols, provider=category_provider),
+    )
+    return prices, sectors, categories
@@ -27,7 +27,7 @@ from humbldata.core.utils.openbb_helpers import (
 from humbldata.toolbox.toolbox_controller import Toolbox
 
 
-async def generate_user_table_toolbox(
+def generate_user_table_toolbox(
     symbols: str | list[str], user_role: str
 ) -> Toolbox:
     """
@@ -228,7 +228,7 @@ async def aget_asset_class_filter(
 async def aggregate_user_table_data(symbols: str | list[str] | pl.Series):
     # First, fetch ETF data
     etf_data = await aget_etf_category(symbols=symbols)
-    toolbox = await generate_user_table_toolbox(
+    toolbox = generate_user_table_toolbox(
         symbols=symbols, user_role="anonymous"
     )
     mandelbrot = toolbox.technical.mandelbrot_channel().to_polars(collect=False)
@@ -271,7 +271,8 @@ def _check_required_columns(data: pl.DataFrame | pl.LazyFrame, *columns: str):
     --------
     >>> check_required_columns(data, "open", "close", "high", "low")
     """
-    missing_columns = [col for col in columns if col not in data.columns]
+    available_columns = set(data.columns)
+    missing_columns = [col for col in columns if col not in available_columns]
     if missing_columns:
         msg = f"Missing required columns: {', '.join(missing_columns)}"
         raise HumblDataError(msg)
@@ -313,7 +314,8 @@ def _set_sort_cols(
     >>> _set_sort_cols(df, "symbol", "window_index")
     ['symbol']
     """
-    present_columns = [col for col in columns if col in data.columns]
+    available_columns = set(data.columns)
+    present_columns = [col for col in columns if col in available_columns]
     return present_columns if present_columns else None
 
 
@@ -354,7 +356,8 @@ def _set_over_cols(
     >>> _set_over_cols(df, "symbol", "window_index")
     ['symbol']
     """
-    present_columns = [col for col in columns if col in data.columns]
+    available_columns = set(data.columns)
+    present_columns = [col for col in columns if col in available_columns]
     return present_columns if present_columns else None
 
 
@@ -512,10 +515,7 @@ def detrend(
             raise HumblDataError(msg)
 
     if isinstance(data, pl.DataFrame | pl.LazyFrame):
-        if (
-            _detrend_value_col not in data.columns
-            or _detrend_col not in data.columns
-        ):
+        if not {_detrend_value_col, _detrend_col}.issubset(data.columns):
             msg = f"Both {_detrend_value_col} and {_detrend_col} must be columns in the data."
             raise HumblDataError(msg)
         detrended = data.set_sorted(sort_cols).with_columns(
@@ -1,12 +1,19 @@
-from unittest.mock import patch
+import asyncio
+import threading
+from unittest.mock import MagicMock, call, patch
 
 import polars as pl
 import pytest
 from openbb_core.app.model.abstract.error import OpenBBError
 
-from humbldata.core.utils.openbb_helpers import get_latest_price, obb_login
+from humbldata.core.utils import openbb_helpers
+from humbldata.core.utils.openbb_helpers import (
+    aget_latest_price,
+    get_latest_price,
+    obb_login,
+)
 
-pytestmark = pytest.mark.skip(reason="Need to figure out OBB Login")
+skip_obb_login = pytest.mark.skip(reason="Need to figure out OBB Login")
 
 # skip_if_not_logged_in = pytest.mark.skipif(
 #     not obb_login(), reason="Login failed"
@@ -16,8 +23,32 @@ pytestmark = pytest.mark.skip(reason="Need to figure out OBB Login")
 # potentially mock the obb function call
 
 
+# FIXTURES (data used in tests) ================================================
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    """Start every test with empty OpenBB helper caches."""
+    openbb_helpers.clear_openbb_caches()
+    yield
+    openbb_helpers.clear_openbb_caches()
+
+
+@pytest.fixture()
+def mock_obb():
+    """Patch the `obb` app used by openbb_helpers with a MagicMock."""
+    with patch.object(openbb_helpers, "obb") as mocked:
+        yield mocked
+
+
+def _obbject(data: dict) -> MagicMock:
+    """Build a fake OBBject whose `to_polars()` returns `data`."""
+    result = MagicMock()
+    result.to_polars.return_value = pl.DataFrame(data)
+    return result
+
+
 # @skip_if_not_logged_in
 # @pytest.mark.skip()
+@skip_obb_login
 @pytest.mark.parametrize(
     "symbol",
     ["AAPL", ["AAPL", "GOOGL"]],
@@ -33,3 +64,338 @@ def test_get_latest_price_with_invalid_symbol():
     """Test that get_recent_price raises a ValueError when an invalid symbol is passed."""
     with pytest.raises(OpenBBError):
         get_latest_price("")
+
+
+def test_aget_latest_price_partial_cache_hit_mixed_branches(mock_obb):
+    """Cached and fetched quotes from different column branches concatenate."""
+    mock_obb.equity.price.quote.side_effect = [
+        _obbject(
+            {
+                "symbol": ["AAPL", "XLE"],
+                "asset_type": ["EQUITY", "ETF"],
+                "last_price": [190.0, None],
+                "prev_close": [189.0, 95.0],
+            }
+        ),
+        _obbject({"symbol": ["SPY"], "prev_close": [500.0]}),
+    ]
+
+    asyncio.run(aget_latest_price(["AAPL", "XLE"]))
+    out = asyncio.run(aget_latest_price(["AAPL", "SPY"])).collect()
+
+    assert out.columns == ["symbol", "last_price"]
+    assert out.to_dicts() == [
+        {"symbol": "AAPL", "last_price": 190.0},
+        {"symbol": "SPY", "last_price": 500.0},
+    ]
+    assert mock_obb.equity.price.quote.call_args.args[0] == ["SPY"]
+
+
+def test_aget_equity_sector_cache_is_keyed_by_provider(mock_obb):
+    """A symbol cached for one provider is fetched again for another."""
+    mock_obb.equity.profile.return_value = _obbject(
+        {"symbol": ["AAPL"], "sector": ["Tech"]}
+    )
+
+    asyncio.run(openbb_helpers.aget_equity_sector("AAPL", provider="fmp"))
+    asyncio.run(openbb_helpers.aget_equity_sector("AAPL", provider="yfinance"))
+
+    assert mock_obb.equity.profile.call_args_list == [
+        call(["AAPL"], provider="fmp"),
+        call(["AAPL"], provider="yfinance"),
+    ]
+
+
+def test_aget_equity_sector_cache_expires_after_a_day(mock_obb):
+    """Sectors are served from cache for 24 hours and refetched after."""
+    mock_obb.equity.profile.return_value = _obbject(
+        {"symbol": ["AAPL"], "sector": ["Tech"]}
+    )
+
+    for now in [100.0, 86_500.0, 86_501.0]:
+        with patch.object(openbb_helpers, "time") as clock:
+            clock.monotonic.return_value = now
+            asyncio.run(openbb_helpers.aget_equity_sector("AAPL"))
+
+    assert mock_obb.equity.profile.call_args_list == [
+        call(["AAPL"], provider="yfinance")
+    ] * 2
+
+
+def test_get_equity_sector_only_fetches_uncached_symbols(mock_obb):
+    """A second call fetches only the symbols not already cached."""
+    mock_obb.equity.profile.side_effect = [
+        _obbject({"symbol": ["AAPL", "MSFT"], "sector": ["Tech", "Tech"]}),
+        _obbject({"symbol": ["XOM"], "sector": ["Energy"]}),
+    ]
+
+    openbb_helpers.get_equity_sector(["AAPL", "MSFT"])
+    out = openbb_helpers.get_equity_sector(["MSFT", "XOM"]).collect()
+
+    assert mock_obb.equity.profile.call_args_list == [
+        call(["AAPL", "MSFT"], provider="yfinance"),
+        call(["XOM"], provider="yfinance"),
+    ]
+    assert out.to_dicts() == [
+        {"symbol": "MSFT", "sector": "Tech"},
+        {"symbol": "XOM", "sector": "Energy"},
+    ]
+
+
+def test_get_equity_sector_evicts_oldest_symbols_past_maxsize(mock_obb):
+    """Only the newest 1024 symbols stay cached."""
+    symbols = [f"S{index}" for index in range(1025)]
+    mock_obb.equity.profile.side_effect = [
+        _obbject({"symbol": symbols, "sector": ["Tech"] * len(symbols)}),
+        _obbject({"symbol": ["S0"], "sector": ["Tech"]}),
+    ]
+
+    openbb_helpers.get_equity_sector(symbols)
+    openbb_helpers.get_equity_sector(["S0", "S1024"])
+
+    assert mock_obb.equity.profile.call_args == call(
+        ["S0"], provider="yfinance"
+    )
+
+
+def test_aget_equity_sector_full_cache_hit_skips_obb(mock_obb):
+    """A call whose symbols are all cached makes no OpenBB request."""
+    mock_obb.equity.profile.return_value = _obbject(
+        {"symbol": ["AAPL"], "sector": ["Tech"]}
+    )
+
+    asyncio.run(openbb_helpers.aget_equity_sector("AAPL"))
+    out = asyncio.run(openbb_helpers.aget_equity_sector("AAPL")).collect()
+
+    assert mock_obb.equity.profile.call_count == 1
+    assert out.to_dicts() == [{"symbol": "AAPL", "sector": "Tech"}]
+
+
+def test_aget_equity_sector_fallback_is_not_cached(mock_obb):
+    """Null-sector fallbacks are returned but refetched on the next call."""
+    mock_obb.equity.profile.return_value = _obbject({"symbol": ["XLE"]})
+
+    first = asyncio.run(openbb_helpers.aget_equity_sector("XLE")).collect()
+    asyncio.run(openbb_helpers.aget_equity_sector("XLE"))
+
+    assert first.to_dicts() == [{"symbol": "XLE", "sector": None}]
+    assert mock_obb.equity.profile.call_args_list == [
+        call(["XLE"], provider="yfinance")
+    ] * 2
+
+
+def test_aget_etf_category_fallback_is_not_cached(mock_obb):
+    """Null-category fallbacks after an OpenBBError are not cached."""
+    mock_obb.etf.info.side_effect = OpenBBError("no data")
+
+    first = asyncio.run(openbb_helpers.aget_etf_category("AAPL")).collect()
+    asyncio.run(openbb_helpers.aget_etf_category("AAPL"))
+
+    assert first.to_dicts() == [{"symbol": "AAPL", "category": None}]
+    assert mock_obb.etf.info.call_args_list == [
+        call(["AAPL"], provider="yfinance")
+    ] * 2
+
+
+def test_clear_sector_cache_drops_sectors_and_categories(mock_obb):
+    """clear_sector_cache forces both sector and category refetches."""
+    mock_obb.equity.profile.return_value = _obbject(
+        {"symbol": ["AAPL"], "sector": ["Tech"]}
+    )
+    mock_obb.etf.info.return_value = _obbject(
+        {"symbol": ["XLE"], "category": ["Energy"]}
+    )
+
+    asyncio.run(openbb_helpers.aget_equity_sector("AAPL"))
+    asyncio.run(openbb_helpers.aget_etf_category("XLE"))
+    openbb_helpers.clear_sector_cache()
+    asyncio.run(openbb_helpers.aget_equity_sector("AAPL"))
+    asyncio.run(openbb_helpers.aget_etf_category("XLE"))
+
+    assert mock_obb.equity.profile.call_args_list == [
+        call(["AAPL"], provider="yfinance")
+    ] * 2
+    assert mock_obb.etf.info.call_args_list == [
+        call(["XLE"], provider="yfinance")
+    ] * 2
+
+
+def test_aget_etf_category_normalizes_symbol_case(mock_obb):
+    """Lower-case input is fetched and cached under the upper-case symbol."""
+    mock_obb.etf.info.return_value = _obbject(
+        {"symbol": ["XLE"], "category": ["Energy"]}
+    )
+
+    first = asyncio.run(openbb_helpers.aget_etf_category("xle")).collect()
+    second = asyncio.run(openbb_helpers.aget_etf_category(" XLE")).collect()
+
+    assert mock_obb.etf.info.call_args.args[0] == ["XLE"]
+    assert mock_obb.etf.info.call_count == 1
+    assert first.to_dicts() == second.to_dicts()
+    assert first.to_dicts() == [{"symbol": "XLE", "category": "Energy"}]
+
+
+def test_aget_etf_category_single_symbol_skips_join(mock_obb):
+    """One requested symbol returned as-is is used without reindexing."""
+    mock_obb.etf.info.return_value = _obbject(
+        {"symbol": ["XLE"], "category": ["Energy"]}
+    )
+
+    out = asyncio.run(openbb_helpers.aget_etf_category("XLE")).collect()
+
+    assert out.to_dicts() == [{"symbol": "XLE", "category": "Energy"}]
+
+
+def test_aget_etf_category_single_symbol_mismatch_reindexes(mock_obb):
+    """A row for a different symbol is reindexed onto the requested one."""
+    mock_obb.etf.info.return_value = _obbject(
+        {"symbol": ["XLF"], "category": ["Financial"]}
+    )
+
+    out = asyncio.run(openbb_helpers.aget_etf_category("XLE")).collect()
+
+    assert out.to_dicts() == [{"symbol": "XLE", "category": None}]
+
+
+def test_aget_etf_category_multiple_symbols_reindexes(mock_obb):
+    """Several symbols are reindexed so unreturned ones get a null category."""
+    mock_obb.etf.info.return_value = _obbject(
+        {"symbol": ["XLE"], "category": ["Energy"]}
+    )
+
+    out = asyncio.run(
+        openbb_helpers.aget_etf_category(["XLE", "AAPL"])
+    ).collect()
+
+    assert out.to_dicts() == [
+        {"symbol": "XLE", "category": "Energy"},
+        {"symbol": "AAPL", "category": None},
+    ]
+
+
+def test_aget_equity_sector_coalesces_concurrent_calls(mock_obb):
+    """Identical concurrent calls share one request; cancelling one is safe."""
+    release = threading.Event()
+
+    def profile(*args, **kwargs):
+        release.wait(timeout=5)
+        return _obbject({"symbol": ["AAPL"], "sector": ["Tech"]})
+
+    mock_obb.equity.profile.side_effect = profile
+
+    async def scenario():
+        first = asyncio.create_task(openbb_helpers.aget_equity_sector("AAPL"))
+        second = asyncio.create_task(openbb_helpers.aget_equity_sector("AAPL"))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        release.set()
+        shared = await second
+        coalesced_calls = mock_obb.equity.profile.call_count
+        # A finished shared call is forgotten, so a later miss fetches again
+        openbb_helpers.clear_openbb_caches()
+        await openbb_helpers.aget_equity_sector("AAPL")
+        return shared, coalesced_calls
+
+    shared, coalesced_calls = asyncio.run(scenario())
+
+    assert shared.collect().to_dicts() == [{"symbol": "AAPL", "sector": "Tech"}]
+    assert coalesced_calls == 1
+    assert mock_obb.equity.profile.call_args_list == [
+        call(["AAPL"], provider="yfinance")
+    ] * 2
+
+
+def test_aget_equity_bundle_order_and_providers(mock_obb):
+    """The bundle returns price, sector, category and forwards each provider."""
+    mock_obb.equity.price.quote.return_value = _obbject(
+        {"symbol": ["XLE"], "last_price": [95.0]}
+    )
+    mock_obb.equity.profile.return_value = _obbject(
+        {"symbol": ["XLE"], "sector": ["Energy"]}
+    )
+    mock_obb.etf.info.return_value = _obbject(
+        {"symbol": ["XLE"], "category": ["Equity Energy"]}
+    )
+
+    prices, sectors, categories = asyncio.run(
+        openbb_helpers.aget_equity_bundle(
+            "XLE",
+            price_provider="fmp",
+            sector_provider="intrinio",
+            category_provider="yfinance",
+        )
+    )
+
+    assert prices.collect().to_dicts() == [
+        {"symbol": "XLE", "last_price": 95.0}
+    ]
+    assert sectors.collect().to_dicts() == [
+        {"symbol": "XLE", "sector": "Energy"}
+    ]
+    assert categories.collect().to_dicts() == [
+        {"symbol": "XLE", "category": "Equity Energy"}
+    ]
+    assert mock_obb.equity.price.quote.call_args.kwargs == {"provider": "fmp"}
+    assert mock_obb.equity.profile.call_args.kwargs == {"provider": "intrinio"}
+    assert mock_obb.etf.info.call_args.kwargs == {"provider": "yfinance"}
+
+
+def test_aget_etf_category_partial_cache_hit_keeps_input_order(mock_obb):
+    """Cached and fetched categories come back in the requested order."""
+    mock_obb.etf.info.side_effect = [
+        _obbject({"symbol": ["SPY"], "category": ["Large Blend"]}),
+        _obbject({"symbol": ["QQQ"], "category": ["Large Growth"]}),
+    ]
+
+    asyncio.run(openbb_helpers.aget_etf_category("SPY"))
+    out = asyncio.run(
+        openbb_helpers.aget_etf_category(["QQQ", "AAPL", "SPY"])
+    ).collect()
+
+    assert out.to_dicts() == [
+        {"symbol": "QQQ", "category": "Large Growth"},
+        {"symbol": "AAPL", "category": None},
+        {"symbol": "SPY", "category": "Large Blend"},
+    ]
+
+
+def test_aget_latest_price_partial_cache_hit_keeps_input_order(mock_obb):
+    """Cached and fetched quotes come back in the requested order."""
+    mock_obb.equity.price.quote.side_effect = [
+        _obbject({"symbol": ["MSFT"], "last_price": [410.0]}),
+        _obbject({"symbol": ["NVDA", "AAPL"], "last_price": [880.0, 190.0]}),
+    ]
+
+    asyncio.run(aget_latest_price("MSFT"))
+    out = asyncio.run(aget_latest_price(["AAPL", "MSFT", "NVDA"])).collect()
+
+    assert out["symbol"].to_list() == ["AAPL", "MSFT", "NVDA"]
+    assert out["last_price"].to_list() == [190.0, 410.0, 880.0]
+
+
+def test_clear_openbb_caches_forces_a_fresh_quote(mock_obb):
+    """clear_openbb_caches drops cached quotes so the next call refetches."""
+    mock_obb.equity.price.quote.side_effect = [
+        _obbject({"symbol": ["AAPL"], "last_price": [190.0]}),
+        _obbject({"symbol": ["AAPL"], "last_price": [191.0]}),
+    ]
+
+    asyncio.run(aget_latest_price("AAPL"))
+    openbb_helpers.clear_openbb_caches()
+    out = asyncio.run(aget_latest_price("AAPL")).collect()
+
+    assert out.to_dicts() == [{"symbol": "AAPL", "last_price": 191.0}]
+
+
+def test_aget_etf_category_drops_empty_symbols(mock_obb):
+    """A trailing comma or blank entry is not sent to OpenBB as a symbol."""
+    mock_obb.etf.info.return_value = _obbject(
+        {"symbol": ["XLE"], "category": ["Energy"]}
+    )
+
+    out = asyncio.run(openbb_helpers.aget_etf_category("XLE, ,")).collect()
+
+    assert mock_obb.etf.info.call_args == call(["XLE"], provider="yfinance")
+    assert out.to_dicts() == [{"symbol": "XLE", "category": "Energy"}]